@@ -10,11 +10,28 @@ Usage:
 """
 
 import argparse
+import functools
+import os
 import re
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Tuple, Union
 
 
+# Characters allowed in a skill name (lowercase letters, numbers, hyphens only)
+_NAME_ALLOWED = frozenset(string.ascii_lowercase + string.digits + '-')
+
+# ASCII names are sanitized with a translate table; the regex handles the rest
+_NAME_DELETE_TABLE = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if c not in _NAME_ALLOWED
+))
+_NAME_SANITIZE_RE = re.compile(r'[^a-z0-9-]')
+
+# Sentinel for metadata lookups that miss
+_MISSING = object()
+
 # Skill metadata
 SKILL_METADATA = {
     "agno": {
@@ -48,24 +65,64 @@ SKILL_METADATA = {
 }
 
 
-def has_frontmatter(content: str) -> bool:
-    """Check if content already has YAML frontmatter"""
-    return content.strip().startswith('---')
+def has_frontmatter(content: Union[str, bytes]) -> bool:
+    """Check if content (text or raw bytes) already has YAML frontmatter"""
+    marker = b'---' if isinstance(content, bytes) else '---'
+    return content.lstrip().startswith(marker)
+
+
+def read_head(path: Path, size: int = 8) -> bytes:
+    """Read the first bytes of a file after any leading whitespace"""
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(size)
+            if not chunk:
+                return b''
+            head = chunk.lstrip()
+            if head:
+                return head + f.read(size)
+
+
+def sanitize_name(name: str) -> str:
+    """Normalize a skill name to lowercase letters, numbers and hyphens (max 64 chars)"""
+    name = name.lower().replace(' ', '-')
+    if name.isascii():
+        return name.translate(_NAME_DELETE_TABLE)[:64]
+    return _NAME_SANITIZE_RE.sub('', name)[:64]
+
+
+def clamp_description(description: str) -> str:
+    """Ensure description is within the 1024 character limit"""
+    if len(description) > 1024:
+        description = description[:1021] + '...'
+    return description
+
+
+# SKILL_METADATA is static, so normalize it once at import time
+for _metadata in SKILL_METADATA.values():
+    _metadata['name'] = sanitize_name(_metadata['name'])
+    _metadata['description'] = clamp_description(_metadata['description'])
 
 
 def create_frontmatter(skill_name: str, metadata: Dict[str, str]) -> str:
     """Create YAML frontmatter for a skill"""
+    if metadata is SKILL_METADATA.get(skill_name):
+        # Already normalized at import time
+        return _format_frontmatter(metadata['name'], metadata['description'])
+
     name = metadata.get('name', skill_name)
     description = metadata.get('description', f'Comprehensive skill for {skill_name}')
+    return _build_frontmatter(name, description)
 
-    # Ensure name follows format requirements
-    name = name.lower().replace(' ', '-')
-    name = re.sub(r'[^a-z0-9-]', '', name)[:64]
 
-    # Ensure description is within limits
-    if len(description) > 1024:
-        description = description[:1021] + '...'
+@functools.lru_cache(maxsize=None)
+def _build_frontmatter(name: str, description: str) -> str:
+    """Build the frontmatter block from raw name/description (memoized)"""
+    return _format_frontmatter(sanitize_name(name), clamp_description(description))
 
+
+def _format_frontmatter(name: str, description: str) -> str:
+    """Render already-normalized name/description as a frontmatter block"""
     frontmatter = f"""---
 name: {name}
 description: {description}
@@ -75,49 +132,67 @@ description: {description}
     return frontmatter
 
 
-def add_frontmatter_to_file(skill_file: Path, skill_name: str, dry_run: bool = False):
-    """Add frontmatter to a SKILL.md file if it doesn't have one"""
+def get_skill_metadata(skill_name: str) -> Dict[str, str]:
+    """Return the metadata for a skill, falling back to generated defaults"""
+    metadata = SKILL_METADATA.get(skill_name, _MISSING)
+    if metadata is _MISSING:
+        return {
+            'name': skill_name,
+            'description': f'Comprehensive skill for {skill_name.replace("-", " ").title()}'
+        }
+    return metadata
+
+
+def add_frontmatter_to_file(skill_file: Path, skill_name: str, frontmatter: str,
+                            dry_run: bool = False) -> Tuple[bool, str]:
+    """
+    Add the given frontmatter to a SKILL.md file if it doesn't have one.
+
+    Returns (updated, message) instead of printing so callers can batch output.
+    """
+
+    # Check if already has frontmatter (only the file prefix is needed)
+    if has_frontmatter(read_head(skill_file)):
+        return False, f"✓ {skill_name}: Already has frontmatter"
 
     # Read current content
     with open(skill_file, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Check if already has frontmatter
-    if has_frontmatter(content):
-        print(f"✓ {skill_name}: Already has frontmatter")
-        return False
-
-    # Get metadata
-    metadata = SKILL_METADATA.get(skill_name, {})
-    if not metadata:
-        print(f"⚠️  {skill_name}: No metadata found, using defaults")
-        metadata = {
-            'name': skill_name,
-            'description': f'Comprehensive skill for {skill_name.replace("-", " ").title()}'
-        }
-
-    # Create frontmatter
-    frontmatter = create_frontmatter(skill_name, metadata)
+    messages = []
+    if skill_name not in SKILL_METADATA:
+        messages.append(f"⚠️  {skill_name}: No metadata found, using defaults")
 
     # Remove leading title if it exists (will be redundant with name)
-    lines = content.split('\n')
-    if lines and lines[0].startswith('# '):
-        content = '\n'.join(lines[1:]).lstrip()
-
-    # Combine frontmatter and content
-    new_content = frontmatter + content
+    if content.startswith('# '):
+        newline = content.find('\n')
+        content = content[newline + 1:].lstrip() if newline != -1 else ''
 
     if dry_run:
-        print(f"🔍 {skill_name}: Would add frontmatter:")
-        print(frontmatter)
-        return False
+        messages.append(f"🔍 {skill_name}: Would add frontmatter:")
+        messages.append(frontmatter)
+        return False, '\n'.join(messages)
 
-    # Write updated content
+    # Write frontmatter followed by the body (no combined copy in memory)
     with open(skill_file, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+        f.write(frontmatter)
+        f.write(content)
 
-    print(f"✅ {skill_name}: Added frontmatter")
-    return True
+    messages.append(f"✅ {skill_name}: Added frontmatter")
+    return True, '\n'.join(messages)
+
+
+def find_skill_files(output_dir: Path) -> List[Path]:
+    """Return the sorted SKILL.md paths of every skill directory in output_dir"""
+    skill_files = []
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                skill_file = Path(entry.path) / "SKILL.md"
+                if skill_file.is_file():
+                    skill_files.append(skill_file)
+    skill_files.sort()
+    return skill_files
 
 
 def main():
@@ -146,7 +221,7 @@ def main():
         print("🔍 DRY RUN MODE - No files will be modified\n")
 
     # Find all SKILL.md files
-    skill_files = list(output_dir.glob("*/SKILL.md"))
+    skill_files = find_skill_files(output_dir)
 
     if not skill_files:
         print("⚠️  No SKILL.md files found")
@@ -154,11 +229,28 @@ def main():
 
     print(f"Found {len(skill_files)} skill(s):\n")
 
-    updated = 0
-    for skill_file in sorted(skill_files):
-        skill_name = skill_file.parent.name
-        if add_frontmatter_to_file(skill_file, skill_name, args.dry_run):
-            updated += 1
+    # Frontmatter depends only on the skill name, so build it once per name
+    frontmatters = {
+        name: create_frontmatter(name, get_skill_metadata(name))
+        for name in {skill_file.parent.name for skill_file in skill_files}
+    }
+
+    # Files are independent and the work is I/O-bound, so overlap it
+    with ThreadPoolExecutor(max_workers=min(16, len(skill_files))) as executor:
+        results = executor.map(
+            lambda skill_file: add_frontmatter_to_file(
+                skill_file,
+                skill_file.parent.name,
+                frontmatters[skill_file.parent.name],
+                args.dry_run
+            ),
+            skill_files
+        )
+        results = list(results)
+
+    # Write all per-file messages in one go
+    sys.stdout.write(''.join(f"{message}\n" for _, message in results))
+    updated = sum(changed for changed, _ in results)
 
     print(f"\n{'='*60}")
     if args.dry_run:
@@ -13,48 +13,314 @@ Example:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import http.client
 import json
+import mmap
 import os
+import random
+import re
+import shutil
+import signal
+import string
 import subprocess
 import sys
+import threading
 import time
+import urllib.error
+import urllib.request
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import List, Dict
-from urllib.parse import urlparse
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse, urlunparse
+
+
+# SKILL.md body (after the frontmatter), loaded once from SKILL.md.template
+# and filled via string.Template in SkillGenerator.create_skill_md
+SKILL_MD_TEMPLATE = string.Template(
+    (Path(__file__).parent / "SKILL.md.template").read_text(encoding="utf-8")
+)
+
+
+# Frontmatter description for generated skills
+DESCRIPTION_TEMPLATE = (
+    "Comprehensive skill for {title}. "
+    "Use when working with {name}, implementing features, "
+    "deploying applications, or troubleshooting. "
+    "Includes installation, configuration, best practices, and examples."
+)
+
+# Longest skill name whose description always fits in 1024 chars. The name
+# appears once and its title-cased form once; str.title() can expand a
+# character to at most 3 (e.g. "ﬃ" -> "Ffi"), hence the factor of 4.
+_MAX_UNCLAMPED_NAME_LEN = (1024 - len(DESCRIPTION_TEMPLATE.format(title="", name=""))) // 4
+
+# Files up to this size are stored uncompressed when packaging
+_ZIP_STORE_MAX_SIZE = 64
+
+# Runs of characters not allowed in a reference file name
+_URL_SLUG_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_URL_SLUG_MAX_LEN = 80
+
+# Directly fetched reference pages: accepted content types and size cap
+_FETCH_CONTENT_TYPES = ("text/", "application/json", "application/xhtml+xml")
+MAX_FETCH_BYTES = 5 * 1024 * 1024
+
+# URL classification: GitHub host, and "docs."/"doc."/"/docs/"/"documentation" anywhere
+_GITHUB_NETLOC = "github.com"
+_DOC_URL_RE = re.compile(r"docs?\.|/docs/|documentation", re.IGNORECASE)
+
+# git push errors that retrying cannot fix (matched case-insensitively)
+PUSH_FATAL_ERRORS = (
+    "authentication failed",
+    "permission denied",
+    "error: 403",
+    "repository not found",
+    "does not appear to be a git repository",
+    "non-fast-forward",
+    "rejected",
+)
+
+# Upper bound in seconds on the whole push retry loop, including push time
+PUSH_RETRY_BUDGET = 120
+
+# Sentinels in README.md; generated entries are inserted just before them
+README_SKILLS_MARKER = "<!-- SKILLS:END -->"
+README_CONFIGS_MARKER = "<!-- CONFIGS:END -->"
+README_RESOURCES_MARKER = "<!-- RESOURCES:END -->"
+
+
+def normalize_url(url: str) -> str:
+    """Lowercase scheme and host and drop trailing slashes so equivalent URLs compare equal"""
+    parsed = urlparse(url)
+    if not parsed.scheme:
+        return url
+    return urlunparse(parsed._replace(
+        scheme=parsed.scheme.lower(),
+        netloc=parsed.netloc.lower(),
+        path=parsed.path.rstrip("/"),
+    ))
+
+
+@functools.lru_cache(maxsize=1024)
+def detect_url_type(url: str) -> str:
+    """Classify a URL as github, docs, or web (memoized, URLs repeat across steps)"""
+    parsed = urlparse(url)
+
+    if _GITHUB_NETLOC in parsed.netloc:
+        return "github"
+    elif _DOC_URL_RE.search(url):
+        return "docs"
+    else:
+        return "web"
+
+
+def run_streaming(cmd: List[str], timeout: int, tail_lines: int = 20) -> Tuple[int, str, str]:
+    """
+    Run a command, draining stdout/stderr as they are produced.
+
+    Only the last ``tail_lines`` lines of each stream are kept, so memory stays
+    flat on long-running scrapers. Raises subprocess.TimeoutExpired (after
+    killing its process group) if the command, or a child still holding its
+    output open, does not finish within ``timeout`` seconds.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        # Own process group, so a timeout also kills anything it spawned
+        start_new_session=True
+    )
+    tails = (deque(maxlen=tail_lines), deque(maxlen=tail_lines))
+    readers = [
+        threading.Thread(target=tail.extend, args=(stream,), daemon=True)
+        for tail, stream in zip(tails, (proc.stdout, proc.stderr))
+    ]
+    for reader in readers:
+        reader.start()
+
+    deadline = time.monotonic() + timeout
+    try:
+        proc.wait(timeout=timeout)
+        # Background children that inherited stdout/stderr keep the readers
+        # going after the command exits; they share the same deadline
+        for reader in readers:
+            reader.join(timeout=max(0, deadline - time.monotonic()))
+        if any(reader.is_alive() for reader in readers):
+            raise subprocess.TimeoutExpired(cmd, timeout)
+    except BaseException:
+        # Timeout or Ctrl-C (which never reaches the child's own session):
+        # kill the whole process group rather than leave it orphaned
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError):
+            proc.kill()
+        proc.wait()
+        # A process that escaped the kill can keep the pipes open, so wait
+        # at most 5 s in total for the readers
+        grace = time.monotonic() + 5
+        for reader in readers:
+            reader.join(timeout=max(0, grace - time.monotonic()))
+        raise
+    finally:
+        if not any(reader.is_alive() for reader in readers):
+            proc.stdout.close()
+            proc.stderr.close()
+
+    return proc.returncode, "".join(tails[0]), "".join(tails[1])
+
+
+class _TextExtractor(HTMLParser):
+    """Collect the visible text of an HTML page"""
+
+    _SKIP_TAGS = {"script", "style", "noscript"}
+
+    def __init__(self):
+        super().__init__()
+        self.parts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth and data.strip():
+            self.parts.append(data.strip())
+
+
+def html_to_text(html: str) -> str:
+    """Reduce an HTML page to its visible text, one block per line"""
+    extractor = _TextExtractor()
+    extractor.feed(html)
+    return "\n".join(extractor.parts)
+
+
+def _fetch_url(url: str, timeout: int = 30) -> str:
+    """
+    Fetch a URL and return its decoded body (blocking)
+
+    Raises ValueError for non-text responses (PDFs, archives, images);
+    bodies are truncated to MAX_FETCH_BYTES.
+    """
+    request = urllib.request.Request(url, headers={"User-Agent": "create_skill.py"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        content_type = response.headers.get_content_type()
+        if not content_type.startswith(_FETCH_CONTENT_TYPES):
+            raise ValueError(f"unsupported content type {content_type}")
+        charset = response.headers.get_content_charset() or "utf-8"
+        return response.read(MAX_FETCH_BYTES).decode(charset, "replace")
+
+
+async def fetch_pages(urls: List[str], limit: int = 10) -> List[Tuple[str, Optional[str]]]:
+    """
+    Fetch URLs concurrently, at most ``limit`` at a time.
+
+    Returns (url, body) pairs in input order; body is None if the fetch failed.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def fetch(url: str) -> Tuple[str, Optional[str]]:
+        async with semaphore:
+            try:
+                return url, await asyncio.to_thread(_fetch_url, url)
+            except (OSError, ValueError, LookupError):
+                # LookupError: the server declared a charset Python doesn't know
+                return url, None
+
+    return await asyncio.gather(*(fetch(url) for url in urls))
+
+
+def _check_url(url: str, timeout: int = 5) -> Optional[str]:
+    """Return None if the URL is reachable, otherwise a short error description"""
+    if urlparse(url).scheme not in ("http", "https"):
+        return None
+    headers = {"User-Agent": "create_skill.py"}
+    try:
+        urllib.request.urlopen(
+            urllib.request.Request(url, headers=headers, method="HEAD"), timeout=timeout
+        ).close()
+        return None
+    except urllib.error.HTTPError:
+        # Many CDNs and gateways reject HEAD (403/404/405/501) even though
+        # GET works, so any HTTP error is settled by a GET instead
+        pass
+    except (OSError, ValueError, http.client.HTTPException) as e:
+        return str(getattr(e, "reason", e))
+
+    try:
+        urllib.request.urlopen(
+            urllib.request.Request(url, headers=headers), timeout=timeout
+        ).close()
+    except urllib.error.HTTPError as e:
+        return f"HTTP {e.code}"
+    except (OSError, ValueError, http.client.HTTPException) as e:
+        return str(getattr(e, "reason", e))
+    return None
+
+
+async def preflight_urls(urls: List[str], limit: int = 10) -> List[Tuple[str, str]]:
+    """Check URLs concurrently; returns (url, error) pairs for the ones that failed"""
+    semaphore = asyncio.Semaphore(limit)
+
+    async def check(url: str) -> Tuple[str, Optional[str]]:
+        async with semaphore:
+            return url, await asyncio.to_thread(_check_url, url)
+
+    results = await asyncio.gather(*(check(url) for url in urls))
+    return [(url, error) for url, error in results if error is not None]
 
 
 class SkillGenerator:
     """Automated skill generator following established patterns"""
 
+    # Resolved once; None when skill-seekers is not installed
+    _SKILL_SEEKERS_BIN = shutil.which("skill-seekers")
+
     def __init__(self, skill_name: str, urls: List[str], base_dir: Path = None):
         self.skill_name = skill_name.lower().replace(" ", "-")
-        self.urls = urls
+        # Normalized and de-duplicated (first occurrence wins) so every step
+        # sees each source once
+        self.urls = list(dict.fromkeys(map(normalize_url, urls)))
         self.base_dir = base_dir or Path.cwd()
         self.configs_dir = self.base_dir / "configs"
         self.output_dir = self.base_dir / "output"
         self.skill_dir = self.output_dir / self.skill_name
 
+        # URL classification and derived strings, reused by several steps
+        self.kinds = {u: detect_url_type(u) for u in self.urls}
+        self.skill_title = self.skill_name.replace('-', ' ').title()
+        self.github_url = next(
+            (u for u, kind in self.kinds.items() if kind == "github"), self.urls[0]
+        )
+        self._url_list_md = "\n".join(f"- {url}" for url in self.urls)
+        self._url_resources_md = "\n".join(f"- **URL**: {url}" for url in self.urls)
+
     def detect_url_type(self, url: str) -> str:
         """Detect if URL is GitHub, docs, or other"""
-        parsed = urlparse(url)
-
-        if "github.com" in parsed.netloc:
-            return "github"
-        elif any(doc in url.lower() for doc in ["docs.", "doc.", "documentation", "/docs/"]):
-            return "docs"
-        else:
-            return "web"
+        return detect_url_type(url)
 
     def create_config(self) -> Path:
         """Create skill-seekers configuration file in unified format"""
         print(f"📝 Creating configuration for {self.skill_name}...")
 
         # Categorize URLs
-        github_urls = [u for u in self.urls if self.detect_url_type(u) == "github"]
-        doc_urls = [u for u in self.urls if self.detect_url_type(u) in ["docs", "web"]]
+        github_urls = [u for u, kind in self.kinds.items() if kind == "github"]
+        doc_urls = [u for u, kind in self.kinds.items() if kind in ("docs", "web")]
 
         # Build config in "unified" format compatible with skill-seekers
-        skill_title = self.skill_name.replace('-', ' ').title()
+        skill_title = self.skill_title
 
         config = {
             "name": self.skill_name,
@@ -112,8 +378,10 @@ class SkillGenerator:
         config_file = self.configs_dir / f"{self.skill_name}_unified.json"
         config_file.parent.mkdir(exist_ok=True)
 
-        with open(config_file, "w") as f:
-            json.dump(config, f, indent=2)
+        config_file.write_text(
+            json.dumps(config, indent=2, separators=(",", ": "), ensure_ascii=False),
+            encoding="utf-8"
+        )
 
         print(f"✅ Configuration saved to {config_file}")
         print(f"   Format: unified (compatible with skill-seekers)")
@@ -125,25 +393,33 @@ class SkillGenerator:
         print(f"   Timeout: {timeout}s ({timeout//60} minutes)")
         print(f"   This may take a while for large documentation sites...")
 
+        if self._SKILL_SEEKERS_BIN is None:
+            print("⚠️ skill-seekers command not found")
+            print("   Install with: pip install skill-seekers")
+            try:
+                self.fetch_references()
+            except Exception as e:
+                print(f"⚠️ Could not fetch references directly: {e}")
+            print("   Proceeding with manual creation...")
+            return False
+
         try:
             # Use "unified" command for multi-source scraping
-            result = subprocess.run(
-                ["skill-seekers", "unified", "--config", str(config_file)],
-                timeout=timeout,
-                capture_output=True,
-                text=True
+            returncode, stdout, stderr = run_streaming(
+                [self._SKILL_SEEKERS_BIN, "unified", "--config", str(config_file)],
+                timeout=timeout
             )
 
-            if result.returncode == 0:
+            if returncode == 0:
                 print("✅ Skill-seekers completed successfully")
-                print(f"   Output: {result.stdout[:200] if result.stdout else 'No output'}")
+                print(f"   Output: {stdout[:200] if stdout else 'No output'}")
                 return True
             else:
-                print(f"⚠️ Skill-seekers failed with return code {result.returncode}")
-                if result.stderr:
-                    print(f"   Error: {result.stderr[:500]}")
-                if result.stdout:
-                    print(f"   Output: {result.stdout[:500]}")
+                print(f"⚠️ Skill-seekers failed with return code {returncode}")
+                if stderr:
+                    print(f"   Error: {stderr[:500]}")
+                if stdout:
+                    print(f"   Output: {stdout[:500]}")
                 return False
 
         except subprocess.TimeoutExpired:
@@ -161,45 +437,84 @@ class SkillGenerator:
             print("   Proceeding with manual creation...")
             return False
 
+    def fetch_references(self) -> int:
+        """
+        Fetch documentation pages directly into references/.
+
+        Fallback for when skill-seekers is not installed: pages are fetched
+        concurrently and saved as plain text, one file per URL. GitHub URLs
+        are skipped (their HTML is mostly navigation).
+        """
+        doc_urls = [u for u, kind in self.kinds.items() if kind != "github"]
+        if not doc_urls:
+            return 0
+
+        print(f"🌐 Fetching {len(doc_urls)} documentation page(s) directly...")
+        refs_dir = self.skill_dir / "references"
+        os.makedirs(refs_dir, exist_ok=True)
+
+        written = 0
+        for url, html in asyncio.run(fetch_pages(doc_urls)):
+            if html is None:
+                print(f"   ⚠️ Could not fetch {url}")
+                continue
+            # Readable prefix, capped to stay within filename limits, plus a
+            # hash of the full URL so pages differing only in query string or
+            # punctuation don't overwrite each other
+            parsed = urlparse(url)
+            slug = _URL_SLUG_RE.sub("-", parsed.netloc + parsed.path).strip("-") or "index"
+            digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:8]
+            ref_file = refs_dir / f"{slug[:_URL_SLUG_MAX_LEN].rstrip('-')}-{digest}.md"
+            try:
+                ref_file.write_text(f"# {url}\n\n{html_to_text(html)}\n", encoding="utf-8")
+            except OSError as e:
+                print(f"   ⚠️ Could not save {url}: {e}")
+                continue
+            written += 1
+
+        print(f"   Saved {written} page(s) to {refs_dir}")
+        return written
+
     def create_skill_structure(self):
         """Create skill directory structure"""
         print(f"📁 Creating skill directory structure...")
 
-        self.skill_dir.mkdir(parents=True, exist_ok=True)
-        (self.skill_dir / "assets").mkdir(exist_ok=True)
-        (self.skill_dir / "scripts").mkdir(exist_ok=True)
-        (self.skill_dir / "references").mkdir(exist_ok=True)
-
-        # Create .gitkeep files
-        for subdir in ["assets", "scripts", "references"]:
-            (self.skill_dir / subdir / ".gitkeep").touch()
+        # makedirs creates skill_dir itself along with each subdirectory
+        skill_dir = str(self.skill_dir)
+        for subdir in ("assets", "scripts", "references"):
+            path = os.path.join(skill_dir, subdir)
+            os.makedirs(path, exist_ok=True)
+            # Create .gitkeep file (bare O_CREAT: no file object, no utime on re-runs)
+            os.close(os.open(os.path.join(path, ".gitkeep"), os.O_WRONLY | os.O_CREAT, 0o644))
 
         print("✅ Directory structure created")
 
-    def create_frontmatter(self) -> str:
-        """Create YAML frontmatter for SKILL.md"""
-        # Ensure name follows Claude AI format requirements
-        # lowercase letters, numbers, and hyphens only, max 64 chars
-        skill_title = self.skill_name.replace('-', ' ').title()
+    @functools.cached_property
+    def description(self) -> str:
+        """Skill description used in the frontmatter (computed once)"""
+        description = DESCRIPTION_TEMPLATE.format(title=self.skill_title, name=self.skill_name)
 
-        description = (
-            f"Comprehensive skill for {skill_title}. "
-            f"Use when working with {self.skill_name}, implementing features, "
-            f"deploying applications, or troubleshooting. "
-            f"Includes installation, configuration, best practices, and examples."
-        )
-
-        # Ensure description is within 1024 character limit
-        if len(description) > 1024:
+        # Ensure description is within 1024 character limit (only reachable
+        # for names longer than _MAX_UNCLAMPED_NAME_LEN)
+        if len(self.skill_name) > _MAX_UNCLAMPED_NAME_LEN and len(description) > 1024:
             description = description[:1021] + "..."
+        return description
 
-        frontmatter = f"""---
+    @functools.cached_property
+    def frontmatter(self) -> str:
+        """YAML frontmatter for SKILL.md (computed once)"""
+        # Ensure name follows Claude AI format requirements
+        # lowercase letters, numbers, and hyphens only, max 64 chars
+        return f"""---
 name: {self.skill_name}
-description: {description}
+description: {self.description}
 ---
 
 """
-        return frontmatter
+
+    def create_frontmatter(self) -> str:
+        """Create YAML frontmatter for SKILL.md"""
+        return self.frontmatter
 
     def create_skill_md(self) -> Path:
         """Create comprehensive SKILL.md file"""
@@ -207,210 +522,20 @@ description: {description}
 
         skill_file = self.skill_dir / "SKILL.md"
 
-        # Get primary GitHub URL for reference
-        github_url = next((u for u in self.urls if "github.com" in u), self.urls[0])
-
         # Create YAML frontmatter
         frontmatter = self.create_frontmatter()
 
-        # Create comprehensive skill template
-        content = frontmatter + f"""## When to Use This Skill
-
-Use this skill when you need to work with {self.skill_name}, including:
-- Understanding core concepts and architecture
-- Implementing features and integrations
-- Configuring and deploying applications
-- Troubleshooting common issues
-- Following best practices
-
-## Overview
-
-This skill provides comprehensive guidance for working with {self.skill_name}.
-
-**Key Resources:**
-{chr(10).join(f"- {url}" for url in self.urls)}
-
-## Installation
-
-### Prerequisites
-
-Check the official documentation for specific prerequisites.
-
-### Basic Installation
-
-```bash
-# Installation instructions will vary by technology
-# Refer to official documentation
-```
-
-## Quick Start
-
-### Basic Example
-
-```python
-# Example code for {self.skill_name}
-# This will be technology-specific
-```
-
-## Core Concepts
-
-### Architecture
-
-{self.skill_name.replace('-', ' ').title()} follows modern architecture patterns.
-
-### Key Components
-
-1. **Component 1**: Description
-2. **Component 2**: Description
-3. **Component 3**: Description
-
-## Configuration
-
-### Basic Configuration
-
-```yaml
-# Example configuration
-# Technology-specific settings
-```
-
-### Environment Variables
-
-Common environment variables:
-- `VAR_NAME`: Description
-
-## Common Patterns
-
-### Pattern 1: Basic Usage
-
-```python
-# Example implementation
-```
-
-### Pattern 2: Advanced Usage
-
-```python
-# Advanced example
-```
-
-## API Reference
-
-### Core APIs
-
-Refer to official documentation for complete API reference:
-{chr(10).join(f"- {url}" for url in self.urls)}
-
-## Integration Examples
-
-### Example 1: Basic Integration
-
-```python
-# Integration example
-```
-
-### Example 2: Advanced Integration
-
-```python
-# Advanced integration
-```
-
-## Best Practices
-
-### Development
-
-1. **Follow conventions**: Adhere to community standards
-2. **Use type hints**: Improve code quality
-3. **Write tests**: Ensure reliability
-4. **Document code**: Help future maintainers
-
-### Production
-
-1. **Security**: Implement proper authentication and authorization
-2. **Performance**: Optimize for production workloads
-3. **Monitoring**: Set up logging and metrics
-4. **Scalability**: Design for growth
-
-### Common Pitfalls
-
-1. **Issue**: Description
-   - **Solution**: How to fix
-
-2. **Issue**: Description
-   - **Solution**: How to fix
-
-## Troubleshooting
-
-### Common Issues
-
-#### Issue 1: Problem Description
-
-**Symptoms:**
-- Symptom description
-
-**Solution:**
-```bash
-# Solution command or code
-```
-
-#### Issue 2: Problem Description
-
-**Symptoms:**
-- Symptom description
-
-**Solution:**
-- Resolution steps
-
-### Debugging Tips
-
-1. Check logs for error messages
-2. Verify configuration settings
-3. Ensure dependencies are installed
-4. Review documentation for updates
-
-## Advanced Topics
-
-### Topic 1: Advanced Feature
-
-Description and implementation details.
-
-### Topic 2: Optimization
-
-Performance optimization techniques.
-
-### Topic 3: Scaling
-
-Scaling strategies for production.
-
-## Resources
-
-### Official Documentation
-{chr(10).join(f"- {url}" for url in self.urls)}
-
-### Community Resources
-- Community forums and discussions
-- Example repositories
-- Video tutorials
-
-### Related Tools
-- Tool 1: Description
-- Tool 2: Description
-
-## Contributing
-
-Refer to the official repository for contribution guidelines:
-{github_url}
-
-## Version Information
-
-**Last Updated**: {time.strftime("%Y-%m-%d")}
-**Skill Version**: 1.0.0
-
----
-
-*Note: This skill is generated from official documentation and community resources. Always refer to the latest official documentation for the most up-to-date information.*
-"""
-
-        with open(skill_file, "w") as f:
-            f.write(content)
+        # Stream frontmatter and the filled template straight to the file
+        # rather than concatenating them into one string first
+        with open(skill_file, "w", encoding="utf-8", buffering=64 * 1024) as f:
+            f.write(frontmatter)
+            f.write(SKILL_MD_TEMPLATE.safe_substitute({
+                "skill_name": self.skill_name,
+                "skill_title": self.skill_title,
+                "urls_bullets": self._url_list_md,
+                "github_url": self.github_url,
+                "date": time.strftime("%Y-%m-%d"),
+            }))
 
         file_size = skill_file.stat().st_size
         print(f"✅ SKILL.md created ({file_size:,} bytes)")
@@ -427,51 +552,71 @@ Refer to the official repository for contribution guidelines:
 
         zip_file = self.output_dir / f"{self.skill_name}.zip"
 
-        # Remove existing zip if present
-        if zip_file.exists():
-            zip_file.unlink()
-
-        # Create zip
-        result = subprocess.run(
-            ["zip", "-r", str(zip_file.name), str(self.skill_dir.name)],
-            cwd=self.output_dir,
-            capture_output=True,
-            text=True
-        )
-
-        if result.returncode == 0:
-            file_size = zip_file.stat().st_size
-            print(f"✅ Skill packaged as {zip_file} ({file_size:,} bytes)")
-            return zip_file
-        else:
-            print(f"❌ Failed to create zip: {result.stderr}")
+        # Create zip in-process (mode "w" replaces any existing archive),
+        # walking the skill directory once with scandir
+        try:
+            with zipfile.ZipFile(zip_file, "w", compression=zipfile.ZIP_DEFLATED,
+                                 compresslevel=6, allowZip64=True) as zf:
+                zf.write(self.skill_dir, self.skill_dir.name)
+                stack = [str(self.skill_dir)]
+                while stack:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            arcname = os.path.relpath(entry.path, self.output_dir)
+                            if entry.is_dir(follow_symlinks=False):
+                                zf.write(entry.path, arcname)
+                                stack.append(entry.path)
+                            elif entry.stat().st_size <= _ZIP_STORE_MAX_SIZE:
+                                # Deflate cannot shrink tiny files like .gitkeep
+                                zf.write(entry.path, arcname, compress_type=zipfile.ZIP_STORED)
+                            else:
+                                zf.write(entry.path, arcname)
+        except OSError as e:
+            print(f"❌ Failed to create zip: {e}")
             return None
 
+        file_size = zip_file.stat().st_size
+        print(f"✅ Skill packaged as {zip_file} ({file_size:,} bytes)")
+        return zip_file
+
     def update_readme(self):
         """Update README.md with new skill"""
         print(f"📝 Updating README.md...")
 
         readme_file = self.base_dir / "README.md"
 
-        if not readme_file.exists():
+        # Check if skill already exists in README: match its section header or
+        # the "packaged skill" line that every skill section carries. The scan
+        # runs over a read-only mmap, so an existing skill returns before the
+        # README is decoded into memory.
+        section_re = re.compile(
+            rf"^(?:### {re.escape(self.skill_title)} Skill|"
+            rf"1\. Use the packaged skill: `output/{re.escape(self.skill_name)}\.zip`)\s*$".encode("utf-8"),
+            re.MULTILINE
+        )
+        try:
+            with open(readme_file, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        already_present = section_re.search(mm) is not None
+                except ValueError:
+                    # Empty files cannot be mapped
+                    already_present = False
+        except FileNotFoundError:
             print("⚠️ README.md not found, skipping update")
             return
 
-        # Read current README
-        with open(readme_file, "r") as f:
-            content = f.read()
-
-        # Check if skill already exists in README
-        if self.skill_name in content.lower():
+        if already_present:
             print(f"⚠️ Skill {self.skill_name} already exists in README.md")
             return
 
+        # Only a genuinely new skill needs the README as text
+        content = readme_file.read_text(encoding="utf-8")
+
         # Create skill section
-        skill_title = self.skill_name.replace('-', ' ').title()
-        github_url = next((u for u in self.urls if "github.com" in u), self.urls[0])
+        skill_title = self.skill_title
 
-        new_section = f"""
-### {skill_title} Skill
+        new_section = f"""### {skill_title} Skill
 
 **Version:** 1.0.0
 **Description:** Comprehensive skill for {skill_title}.
@@ -494,102 +639,82 @@ Refer to the official repository for contribution guidelines:
 
 """
 
-        # Find insertion point (before "## How to Create Skills")
-        insertion_marker = "## How to Create Skills"
-
-        if insertion_marker in content:
-            parts = content.split(insertion_marker, 1)
-            updated_content = parts[0] + new_section + insertion_marker + parts[1]
-
-            # Add to config files list
-            config_section = "## Configuration Files"
-            if config_section in updated_content:
-                # Find the last config line
-                lines = updated_content.split('\n')
-                for i, line in enumerate(lines):
-                    if line.startswith('- `') and '_github.json`' in line:
-                        last_config_line = i
-
-                # Insert new config line after the last one
-                new_config_line = f"- `{self.skill_name}_github.json` - GitHub configuration for {skill_title}"
-                lines.insert(last_config_line + 1, new_config_line)
-                updated_content = '\n'.join(lines)
-
-            # Add to resources section
-            resource_section = f"""
-### {skill_title}
-{chr(10).join(f"- **URL**: {url}" for url in self.urls)}
+        if README_SKILLS_MARKER not in content:
+            print(f"⚠️ Could not find insertion point in README.md (missing {README_SKILLS_MARKER})")
+            return
+
+        # Each block is spliced in just before its sentinel; a missing
+        # optional sentinel leaves that section untouched
+        for marker in (README_CONFIGS_MARKER, README_RESOURCES_MARKER):
+            if marker not in content:
+                print(f"⚠️ {marker} not found in README.md, skipping that section")
+        config_line = f"- `{self.skill_name}_unified.json` - Unified configuration for {skill_title}\n"
+        resource_section = f"""### {skill_title}
+{self._url_resources_md}
+
 """
+        updated_content = (
+            content
+            .replace(README_SKILLS_MARKER, new_section + README_SKILLS_MARKER, 1)
+            .replace(README_CONFIGS_MARKER, config_line + README_CONFIGS_MARKER, 1)
+            .replace(README_RESOURCES_MARKER, resource_section + README_RESOURCES_MARKER, 1)
+        )
 
-            if "### Tools" in updated_content:
-                parts = updated_content.split("### Tools", 1)
-                updated_content = parts[0] + resource_section + "\n### Tools" + parts[1]
+        readme_file.write_text(updated_content, encoding="utf-8")
 
-            with open(readme_file, "w") as f:
-                f.write(updated_content)
+        print("✅ README.md updated")
 
-            print("✅ README.md updated")
-        else:
-            print("⚠️ Could not find insertion point in README.md")
+    def _git(self, *args: str, **kwargs) -> subprocess.CompletedProcess:
+        """Run a git command against base_dir (via -C rather than cwd=)"""
+        return subprocess.run(["git", "-C", str(self.base_dir), *args], **kwargs)
 
     def git_commit_and_push(self):
         """Commit and push changes to git"""
         print(f"🔄 Committing and pushing to git...")
 
-        # Check if we're in a git repository
-        result = subprocess.run(
-            ["git", "rev-parse", "--git-dir"],
-            cwd=self.base_dir,
-            capture_output=True
-        )
+        # Check for a git repository and get the current branch in one call
+        # (fails outside a repository and on a detached HEAD)
+        result = self._git("symbolic-ref", "--short", "HEAD", capture_output=True, text=True)
 
         if result.returncode != 0:
-            print("⚠️ Not a git repository, skipping git operations")
+            print("⚠️ Not a git repository or not on a branch, skipping git operations")
             return
 
-        # Get current branch
-        result = subprocess.run(
-            ["git", "branch", "--show-current"],
-            cwd=self.base_dir,
-            capture_output=True,
-            text=True
-        )
         current_branch = result.stdout.strip()
 
         # Add files
         files_to_add = [
-            f"configs/{self.skill_name}_github.json",
+            f"configs/{self.skill_name}_unified.json",
             f"output/{self.skill_name}/",
             f"output/{self.skill_name}.zip",
             "README.md"
         ]
 
-        subprocess.run(
-            ["git", "add"] + files_to_add,
-            cwd=self.base_dir
-        )
+        # Output is only looked at on failure, so keep it as undecoded bytes
+        result = self._git("add", *files_to_add, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            print(f"⚠️ git add failed: {result.stderr.decode('utf-8', 'replace').strip()}")
 
         # Create commit message
-        commit_msg = f"""Add comprehensive {self.skill_name.replace('-', ' ').title()} skill
+        commit_msg = f"""Add comprehensive {self.skill_title} skill
 
 This commit adds a new Claude skill for {self.skill_name.replace('-', ' ')}.
 
 Changes:
-- Created configs/{self.skill_name}_github.json configuration file
+- Created configs/{self.skill_name}_unified.json configuration file
 - Created output/{self.skill_name}/SKILL.md with comprehensive guide
 - Packaged skill as output/{self.skill_name}.zip
 - Updated README.md with {self.skill_name} skill documentation
 
 Resources:
-{chr(10).join(f"- {url}" for url in self.urls)}
+{self._url_list_md}
 """
 
         # Commit
-        result = subprocess.run(
-            ["git", "commit", "-m", commit_msg],
-            cwd=self.base_dir,
-            capture_output=True,
-            text=True
+        result = self._git(
+            "commit", "-m", commit_msg,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
 
         if result.returncode == 0:
@@ -598,36 +723,65 @@ Resources:
             # Push with retry logic
             max_retries = 4
             retry_delays = [2, 4, 8, 16]
+            deadline = time.monotonic() + PUSH_RETRY_BUDGET
 
             for attempt in range(max_retries):
                 print(f"📤 Pushing to {current_branch} (attempt {attempt + 1}/{max_retries})...")
 
-                result = subprocess.run(
-                    ["git", "push", "-u", "origin", current_branch],
-                    cwd=self.base_dir,
-                    capture_output=True,
-                    text=True
-                )
+                try:
+                    # A hung push (credential prompt, stalled network) counts
+                    # against the retry budget like any other failed attempt
+                    result = self._git(
+                        "push", "-u", "origin", current_branch,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                        timeout=max(1, deadline - time.monotonic())
+                    )
+                except subprocess.TimeoutExpired:
+                    error = "push timed out"
+                else:
+                    if result.returncode == 0:
+                        print(f"✅ Pushed to {current_branch}")
+                        return
 
-                if result.returncode == 0:
-                    print(f"✅ Pushed to {current_branch}")
+                    error = result.stderr.decode("utf-8", "replace").strip()
+                    if any(pattern in error.lower() for pattern in PUSH_FATAL_ERRORS):
+                        print(f"❌ Push failed (not retrying): {error}")
+                        return
+
+                if attempt == max_retries - 1:
+                    print(f"❌ Push failed after {max_retries} attempts: {error}")
                     return
-                else:
-                    if attempt < max_retries - 1:
-                        delay = retry_delays[attempt]
-                        print(f"⚠️ Push failed, retrying in {delay}s...")
-                        time.sleep(delay)
-                    else:
-                        print(f"❌ Push failed after {max_retries} attempts: {result.stderr}")
-        else:
-            print(f"⚠️ Nothing to commit or commit failed: {result.stderr}")
 
-    def generate(self, skip_git: bool = False, skip_skill_seekers: bool = False):
-        """Run the complete skill generation pipeline with hybrid approach"""
-        print(f"\n{'='*60}")
-        print(f"🚀 Generating Claude Skill: {self.skill_name}")
-        print(f"{'='*60}\n")
+                # Jitter spreads out retries from concurrent runs
+                delay = retry_delays[attempt] * (1 + random.random() * 0.25)
+                if time.monotonic() + delay > deadline:
+                    print(f"❌ Push failed, retry time budget exhausted: {error}")
+                    return
 
+                print(f"⚠️ Push failed ({error.splitlines()[0] if error else 'no output'}), "
+                      f"retrying in {delay:.1f}s...")
+                time.sleep(delay)
+        else:
+            print(f"⚠️ Nothing to commit or commit failed: "
+                  f"{result.stderr.decode('utf-8', 'replace').strip()}")
+
+    def preflight(self) -> bool:
+        """Check that every URL is reachable before doing any work"""
+        print(f"🔎 Checking {len(self.urls)} URL(s)...")
+        failures = asyncio.run(preflight_urls(self.urls))
+        if not failures:
+            print("✅ All URLs reachable")
+            return True
+
+        print(f"❌ {len(failures)} URL(s) unreachable:")
+        for url, error in failures:
+            print(f"   - {url} ({error})")
+        print("   Fix the URLs or rerun with --skip-preflight")
+        return False
+
+    def scrape(self, skip_skill_seekers: bool = False) -> bool:
+        """Create the configuration and run skill-seekers (pipeline steps 1-2)"""
         # Step 1: Create configuration
         config_file = self.create_config()
 
@@ -648,6 +802,30 @@ Resources:
         else:
             print("\n⏭️  Skipping skill-seekers (--skip-skill-seekers flag)")
 
+        return seekers_success
+
+    def generate(
+        self,
+        skip_git: bool = False,
+        skip_skill_seekers: bool = False,
+        skip_preflight: bool = False
+    ) -> bool:
+        """
+        Run the complete skill generation pipeline with hybrid approach
+
+        Returns False if the URL preflight check failed and nothing was done.
+        """
+        print(f"\n{'='*60}")
+        print(f"🚀 Generating Claude Skill: {self.skill_name}")
+        print(f"{'='*60}\n")
+
+        # Fail fast on unreachable URLs before writing anything
+        if not skip_preflight and not self.preflight():
+            return False
+
+        # Steps 1-2: Configuration and skill-seekers
+        seekers_success = self.scrape(skip_skill_seekers)
+
         # Step 3: Create skill structure (if not already created by skill-seekers)
         print("\n" + "="*60)
         print("STEP 3: Ensuring directory structure")
@@ -666,17 +844,17 @@ Resources:
         else:
             self.create_skill_md()
 
-        # Step 5: Package skill
-        print("\n" + "="*60)
-        print("STEP 5: Packaging skill")
-        print("="*60)
-        zip_file = self.package_skill()
-
-        # Step 6: Update README
+        # Steps 5-6: Package skill and update README. They are independent
+        # (neither reads the other's output), so zip compression overlaps the
+        # README rewrite.
         print("\n" + "="*60)
-        print("STEP 6: Updating README.md")
+        print("STEPS 5-6: Packaging skill and updating README.md")
         print("="*60)
-        self.update_readme()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            zip_future = executor.submit(self.package_skill)
+            readme_future = executor.submit(self.update_readme)
+            zip_file = zip_future.result()
+            readme_future.result()
 
         # Step 7: Git commit and push
         if not skip_git:
@@ -694,20 +872,27 @@ Resources:
         print(f"\nSkill location: {self.skill_dir}")
         print(f"Package: {zip_file}")
 
-        # Check references directory
+        # Check references directory: one scandir pass, no separate exists()
+        # check, and only the entries that are displayed get stat()ed
         refs_dir = self.skill_dir / "references"
-        if refs_dir.exists():
-            ref_files = list(refs_dir.glob("*.md"))
-            if ref_files:
-                print(f"\n📚 References populated: {len(ref_files)} files")
-                for ref_file in ref_files[:5]:  # Show first 5
-                    size = ref_file.stat().st_size
-                    print(f"   - {ref_file.name} ({size:,} bytes)")
-                if len(ref_files) > 5:
-                    print(f"   ... and {len(ref_files) - 5} more")
-            else:
-                print(f"\n⚠️  References directory is empty")
-                print(f"   Consider running skill-seekers manually or enhancing with Claude")
+        try:
+            with os.scandir(refs_dir) as entries:
+                ref_files = [
+                    entry for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            ref_files = None
+
+        if ref_files:
+            print(f"\n📚 References populated: {len(ref_files)} files")
+            for entry in ref_files[:5]:  # Show first 5
+                print(f"   - {entry.name} ({entry.stat().st_size:,} bytes)")
+            if len(ref_files) > 5:
+                print(f"   ... and {len(ref_files) - 5} more")
+        elif ref_files is not None:
+            print(f"\n⚠️  References directory is empty")
+            print(f"   Consider running skill-seekers manually or enhancing with Claude")
 
         print(f"\n{'='*60}")
         print(f"NEXT STEPS")
@@ -731,6 +916,7 @@ Resources:
             print("   cd output && rm {}.zip && zip -r {}.zip {}/".format(
                 self.skill_name, self.skill_name, self.skill_name))
         print()
+        return True
 
 
 def main():
@@ -768,6 +954,12 @@ Examples:
         help="Skip skill-seekers execution (manual mode only)"
     )
 
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Skip the URL reachability check before generation"
+    )
+
     parser.add_argument(
         "--base-dir",
         type=Path,
@@ -790,10 +982,12 @@ Examples:
     )
 
     try:
-        generator.generate(
+        if not generator.generate(
             skip_git=args.skip_git,
-            skip_skill_seekers=args.skip_skill_seekers
-        )
+            skip_skill_seekers=args.skip_skill_seekers,
+            skip_preflight=args.skip_preflight
+        ):
+            sys.exit(1)
     except KeyboardInterrupt:
         print("\n\n⚠️ Operation cancelled by user")
         sys.exit(1)
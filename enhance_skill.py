@@ -19,6 +19,70 @@ from pathlib import Path
 from typing import List
 
 
+# Enhancement checklist: (category, items) in display order
+_CHECKLIST = (
+    ("Read Official Documentation", (
+        "Visit all documentation URLs",
+        "Extract key concepts and terminology",
+        "Understand architecture and design patterns",
+        "Note installation and setup steps"
+    )),
+    ("Extract Code Examples", (
+        "Find quick start examples",
+        "Collect common use cases",
+        "Gather integration patterns",
+        "Document API usage examples"
+    )),
+    ("Review GitHub Repository", (
+        "Check README.md for overview",
+        "Review examples/ directory",
+        "Check docs/ directory",
+        "Look at tests/ for usage patterns",
+        "Review issues for common problems"
+    )),
+    ("Add Specific Details", (
+        "Replace generic placeholders with actual code",
+        "Add real configuration examples",
+        "Include actual environment variables",
+        "Document real API endpoints/methods"
+    )),
+    ("Include Best Practices", (
+        "Security considerations",
+        "Performance optimization tips",
+        "Production deployment advice",
+        "Common pitfalls and solutions"
+    )),
+    ("Add Troubleshooting", (
+        "Common error messages and fixes",
+        "Debugging techniques",
+        "FAQ from documentation",
+        "Community solutions"
+    )),
+    ("Verify Completeness", (
+        "All sections have real content",
+        "Code examples are tested/valid",
+        "Links are working",
+        "Information is current"
+    ))
+)
+
+# Research tips shown after the checklist
+_TIPS = (
+    "Use WebFetch to read documentation pages",
+    "Clone GitHub repo to review example code",
+    "Search for 'Quick Start' or 'Getting Started' sections",
+    "Look for 'Examples' or 'Tutorials' directories",
+    "Check for official blog posts or guides",
+    "Review community resources and discussions"
+)
+
+
+def load_config(config_file: Path) -> dict:
+    """Load a JSON config file"""
+    with open(config_file, "r") as f:
+        return json.load(f)
+
+
 def enhance_skill(skill_name: str, base_dir: Path = None):
     """
     Enhance a skill by providing guidance on what to research and include.
@@ -40,8 +104,7 @@ def enhance_skill(skill_name: str, base_dir: Path = None):
         sys.exit(1)
 
     # Load config to get URLs
-    with open(config_file, "r") as f:
-        config = json.load(f)
+    config = load_config(config_file)
 
     print(f"\n{'='*60}")
     print(f"📝 Skill Enhancement Checklist: {skill_name}")
@@ -60,71 +123,16 @@ def enhance_skill(skill_name: str, base_dir: Path = None):
 
     print("✅ Enhancement Checklist:\n")
 
-    checklist = [
-        ("Read Official Documentation", [
-            "Visit all documentation URLs",
-            "Extract key concepts and terminology",
-            "Understand architecture and design patterns",
-            "Note installation and setup steps"
-        ]),
-        ("Extract Code Examples", [
-            "Find quick start examples",
-            "Collect common use cases",
-            "Gather integration patterns",
-            "Document API usage examples"
-        ]),
-        ("Review GitHub Repository", [
-            "Check README.md for overview",
-            "Review examples/ directory",
-            "Check docs/ directory",
-            "Look at tests/ for usage patterns",
-            "Review issues for common problems"
-        ]),
-        ("Add Specific Details", [
-            "Replace generic placeholders with actual code",
-            "Add real configuration examples",
-            "Include actual environment variables",
-            "Document real API endpoints/methods"
-        ]),
-        ("Include Best Practices", [
-            "Security considerations",
-            "Performance optimization tips",
-            "Production deployment advice",
-            "Common pitfalls and solutions"
-        ]),
-        ("Add Troubleshooting", [
-            "Common error messages and fixes",
-            "Debugging techniques",
-            "FAQ from documentation",
-            "Community solutions"
-        ]),
-        ("Verify Completeness", [
-            "All sections have real content",
-            "Code examples are tested/valid",
-            "Links are working",
-            "Information is current"
-        ])
-    ]
-
-    for i, (category, items) in enumerate(checklist, 1):
-        print(f"{i}. {category}")
-        for item in items:
-            print(f"   ☐ {item}")
-        print()
-
-    print("💡 Tips for Enhancement:\n")
-    tips = [
-        "Use WebFetch to read documentation pages",
-        "Clone GitHub repo to review example code",
-        "Search for 'Quick Start' or 'Getting Started' sections",
-        "Look for 'Examples' or 'Tutorials' directories",
-        "Check for official blog posts or guides",
-        "Review community resources and discussions"
-    ]
-
-    for tip in tips:
-        print(f"  💡 {tip}")
-    print()
+    # Emit the checklist and tips with a single write
+    lines = []
+    for i, (category, items) in enumerate(_CHECKLIST, 1):
+        lines.append(f"{i}. {category}")
+        lines.extend(f"   ☐ {item}" for item in items)
+        lines.append("")
+    lines.append("💡 Tips for Enhancement:\n")
+    lines.extend(f"  💡 {tip}" for tip in _TIPS)
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
     print("🚀 Next Steps:\n")
     print("1. Manually enhance SKILL.md using the checklist above")
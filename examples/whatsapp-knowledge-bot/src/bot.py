@@ -16,16 +16,20 @@ Architecture:
 """
 
 import os
+import re
+import json
 import logging
 import asyncio
-from datetime import datetime
-from typing import Dict, List, Optional
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 
 import httpx
-from fastapi import FastAPI, Request, BackgroundTasks
+from cachetools import TTLCache
+from fastapi import FastAPI, Request, Response, BackgroundTasks
 from pydantic import BaseModel
 from graphiti_core import Graphiti
-from graphiti_core.nodes import EntityNode, EpisodeNode
+from graphiti_core.nodes import EntityNode
 from neo4j import AsyncGraphDatabase
 
 # Configure logging
@@ -47,6 +51,58 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://neo4j:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "password")
 
+# Concurrent Graphiti operations are capped below the Neo4j driver pool size
+NEO4J_MAX_POOL_SIZE = int(os.getenv("NEO4J_MAX_POOL_SIZE", "50"))
+GRAPH_CONCURRENCY = int(os.getenv("GRAPH_CONCURRENCY", "40"))
+
+# Dify responses are streamed and relayed to WhatsApp in sentence-bounded
+# chunks of at least STREAM_CHUNK_MIN_CHARS (set DIFY_STREAMING=false to wait
+# for the complete answer instead)
+DIFY_STREAMING = os.getenv("DIFY_STREAMING", "true").lower() == "true"
+STREAM_CHUNK_MIN_CHARS = int(os.getenv("STREAM_CHUNK_MIN_CHARS", "300"))
+SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
+
+# Conversation history sent to Dify
+CONTEXT_MAX_ITEMS = 3
+CONTEXT_MAX_CHARS = 4000
+
+# Conversation context cache (per phone, dropped when a new episode is written)
+CONTEXT_CACHE_SIZE = 10_000
+CONTEXT_CACHE_TTL = float(os.getenv("CONTEXT_CACHE_TTL", "30"))
+
+# Webhook de-duplication (Evolution API retries redeliver the same message id)
+MESSAGE_DEDUP_SIZE = 100_000
+MESSAGE_DEDUP_TTL = 3600
+
+# Larger webhook bodies are never text messages
+WEBHOOK_MAX_BODY_BYTES = 256 * 1024
+
+# Episode write batching (Graphiti writes are taken off the message path)
+EPISODE_BATCH_SIZE = int(os.getenv("EPISODE_BATCH_SIZE", "32"))
+EPISODE_BATCH_WINDOW = float(os.getenv("EPISODE_BATCH_WINDOW", "0.2"))
+EPISODE_QUEUE_SIZE = int(os.getenv("EPISODE_QUEUE_SIZE", "10000"))
+
+# Conversation log write: one parameterized statement per batch, so Neo4j
+# plans it once and reuses the plan for every flush
+EPISODE_LOG_QUERY = """
+UNWIND $rows AS r
+MERGE (u:User {phone: r.phone})
+CREATE (e:Episode {name: r.name, content: r.content, ts: r.ts})
+CREATE (u)-[:SAID]->(e)
+"""
+
+# Conversation log lookups (indexes are created at startup)
+CONVERSATION_INDEXES = (
+    "CREATE INDEX user_phone IF NOT EXISTS FOR (u:User) ON (u.phone)",
+    "CREATE INDEX episode_ts IF NOT EXISTS FOR (e:Episode) ON (e.ts)",
+)
+CONTEXT_QUERY = """
+MATCH (u:User {phone: $phone})-[:SAID]->(e:Episode)
+RETURN e.content AS content, e.ts AS ts
+ORDER BY e.ts DESC
+LIMIT $limit
+"""
+
 # Initialize FastAPI app
 app = FastAPI(title="WhatsApp Knowledge Bot")
 
@@ -62,61 +118,168 @@ class WhatsAppMessage(BaseModel):
     message_id: str
 
 
+class WebhookKey(BaseModel):
+    """Message key of an Evolution API event"""
+    remoteJid: str = ''
+    fromMe: bool = False
+    id: Optional[str] = None
+
+
+class WebhookMessageBody(BaseModel):
+    """Message content; only plain text (conversation) is handled"""
+    conversation: Optional[str] = None
+
+
+class MessagesUpsertData(BaseModel):
+    """Payload of a messages.upsert event"""
+    key: WebhookKey = WebhookKey()
+    message: Optional[WebhookMessageBody] = None
+    messageTimestamp: int = 0
+
+
+class EvolutionWebhook(BaseModel):
+    """Evolution API webhook envelope; data is validated per event type"""
+    event: Optional[str] = None
+    data: Optional[dict] = None
+
+
 class KnowledgeBot:
     """Main bot class integrating all three skills"""
 
     def __init__(self):
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # One pooled HTTP/2 client shared by Dify and Evolution API calls;
+        # keep-alive connections avoid a new TLS handshake per message
+        self.http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=200,
+                max_keepalive_connections=100,
+                keepalive_expiry=60.0
+            ),
+            headers={"Content-Type": "application/json"}
+        )
+        # Per-service endpoints and auth headers, built once; the client is
+        # shared, so each service's credentials stay off the other's requests
+        self._dify_url = f"{DIFY_API_URL}/v1/chat-messages"
+        self._dify_headers = {"Authorization": f"Bearer {DIFY_API_KEY}"}
+        self._evolution_send_url = f"{EVOLUTION_API_URL}/message/sendText/{EVOLUTION_INSTANCE}"
+        self._evolution_headers = {"apikey": EVOLUTION_API_KEY}
         self.graphiti = None
+        self.driver = None
+        self._graph_sem = asyncio.Semaphore(GRAPH_CONCURRENCY)
+        # phone -> {limit: context}
+        self._ctx_cache = TTLCache(maxsize=CONTEXT_CACHE_SIZE, ttl=CONTEXT_CACHE_TTL)
+        self._seen_messages = TTLCache(maxsize=MESSAGE_DEDUP_SIZE, ttl=MESSAGE_DEDUP_TTL)
+        self.write_queue: asyncio.Queue = asyncio.Queue(maxsize=EPISODE_QUEUE_SIZE)
+        self._writer_task: Optional[asyncio.Task] = None
 
     async def initialize(self):
         """Initialize Graphiti connection"""
         try:
-            driver = AsyncGraphDatabase.driver(
+            self.driver = AsyncGraphDatabase.driver(
                 NEO4J_URI,
-                auth=(NEO4J_USER, NEO4J_PASSWORD)
+                auth=(NEO4J_USER, NEO4J_PASSWORD),
+                max_connection_pool_size=NEO4J_MAX_POOL_SIZE
             )
-            self.graphiti = Graphiti(driver)
+            self.graphiti = Graphiti(self.driver)
             await self.graphiti.build_indices()
+            for index_query in CONVERSATION_INDEXES:
+                await self.driver.execute_query(index_query)
+            self._writer_task = asyncio.create_task(self._episode_writer())
             logger.info("✅ Graphiti initialized successfully")
         except Exception as e:
             logger.error(f"❌ Failed to initialize Graphiti: {e}")
             raise
 
+    def claim_message(self, message_id: str) -> bool:
+        """Mark a message id as seen; returns False if it was already handled"""
+        if message_id in self._seen_messages:
+            return False
+        self._seen_messages[message_id] = True
+        return True
+
     async def get_conversation_context(
         self,
         phone: str,
         limit: int = 5
     ) -> List[Dict]:
         """
-        Retrieve conversation context from Graphiti temporal graph
+        Retrieve conversation context from the temporal graph
 
-        Uses Graphiti skill to query temporal knowledge graph
-        for previous interactions with this user.
+        Reads the user's most recent episodes from the conversation log
+        written alongside Graphiti, using the User(phone) and Episode(ts)
+        indexes instead of a semantic search. Results are cached briefly
+        so back-to-back messages skip the query.
         """
+        cached = self._ctx_cache.get(phone)
+        if cached is not None and limit in cached:
+            return cached[limit]
+
         try:
-            # Search for user entity
-            search_results = await self.graphiti.search(
-                query=f"user {phone} conversations",
-                num_results=limit
-            )
+            # Most recent episodes first
+            async with self._graph_sem:
+                records, _, _ = await self.driver.execute_query(
+                    CONTEXT_QUERY,
+                    phone=phone,
+                    limit=limit
+                )
 
-            context = []
-            for result in search_results:
-                if isinstance(result, EpisodeNode):
-                    context.append({
-                        'timestamp': result.created_at,
-                        'content': result.content,
-                        'relevance': result.score if hasattr(result, 'score') else 1.0
-                    })
+            context = [
+                {
+                    'timestamp': record['ts'].to_native(),
+                    'content': record['content'],
+                    'relevance': 1.0
+                }
+                for record in records
+            ]
 
             logger.info(f"📚 Retrieved {len(context)} context items for {phone}")
+            self._ctx_cache.setdefault(phone, {})[limit] = context
             return context
 
         except Exception as e:
             logger.error(f"❌ Error retrieving context: {e}")
             return []
 
+    def build_dify_payload(
+        self,
+        message: str,
+        context: List[Dict],
+        phone: str,
+        response_mode: str
+    ) -> Dict:
+        """Build the Dify chat-messages request for a message and its context"""
+        # Build context string from the freshest distinct interactions;
+        # users often resend or repeat the same message verbatim
+        seen = set()
+        lines = []
+        total_chars = 0
+        for ctx in sorted(context, key=lambda ctx: ctx['timestamp'], reverse=True):
+            key = ctx['content'].strip().lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            line = f"[{ctx['timestamp']}] {ctx['content']}"
+            if total_chars + len(line) > CONTEXT_MAX_CHARS:
+                continue  # Too long for the remaining budget
+            total_chars += len(line) + 1
+            lines.append(line)
+            if len(lines) == CONTEXT_MAX_ITEMS:
+                break
+        context_str = "\n".join(reversed(lines))  # Oldest first
+
+        return {
+            "inputs": {
+                "phone": phone,
+                "conversation_history": context_str
+            },
+            "query": message,
+            "response_mode": response_mode,
+            "user": phone,
+            "conversation_id": f"whatsapp_{phone}"
+        }
+
     async def process_with_dify(
         self,
         message: str,
@@ -132,31 +295,13 @@ class KnowledgeBot:
         3. Generate intelligent response
         """
         try:
-            # Build context string
-            context_str = "\n".join([
-                f"[{ctx['timestamp']}] {ctx['content']}"
-                for ctx in context[-3:]  # Last 3 interactions
-            ])
-
             # Prepare Dify request
-            payload = {
-                "inputs": {
-                    "phone": phone,
-                    "conversation_history": context_str
-                },
-                "query": message,
-                "response_mode": "blocking",
-                "user": phone,
-                "conversation_id": f"whatsapp_{phone}"
-            }
+            payload = self.build_dify_payload(message, context, phone, "blocking")
 
             # Call Dify API
             response = await self.http_client.post(
-                f"{DIFY_API_URL}/v1/chat-messages",
-                headers={
-                    "Authorization": f"Bearer {DIFY_API_KEY}",
-                    "Content-Type": "application/json"
-                },
+                self._dify_url,
+                headers=self._dify_headers,
                 json=payload
             )
 
@@ -173,12 +318,92 @@ class KnowledgeBot:
             logger.error(f"❌ Error processing with Dify: {e}")
             return "Desculpe, não foi possível processar sua mensagem no momento."
 
+    async def stream_dify_reply(
+        self,
+        message: str,
+        context: List[Dict],
+        phone: str
+    ) -> Tuple[str, bool]:
+        """
+        Generate a response with Dify in streaming mode and relay it to WhatsApp
+
+        Text is sent through Evolution API as it is generated, in chunks of
+        at least STREAM_CHUNK_MIN_CHARS that end on a sentence boundary (only
+        the final remainder may be shorter), so the user sees the start of
+        the answer before generation finishes.
+
+        Returns the full response and whether every chunk was delivered.
+        """
+        parts = []
+        buffer = ""
+        delivered = True
+
+        try:
+            payload = self.build_dify_payload(message, context, phone, "streaming")
+
+            async with self.http_client.stream(
+                "POST",
+                self._dify_url,
+                headers=self._dify_headers,
+                json=payload
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(f"❌ Dify API error: {response.status_code}")
+                    answer = "Desculpe, ocorreu um erro ao processar sua mensagem."
+                    return answer, await self.send_whatsapp_message(phone, answer)
+
+                # Server-sent events: one "data: {...}" line per event
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    event = json.loads(line[5:])
+                    kind = event.get("event")
+
+                    if kind in ("message", "agent_message"):
+                        chunk = event.get("answer", "")
+                        parts.append(chunk)
+                        buffer += chunk
+                        if len(buffer) < STREAM_CHUNK_MIN_CHARS:
+                            continue
+                        # Cut at the last sentence boundary that still leaves
+                        # at least STREAM_CHUNK_MIN_CHARS in the chunk; keep
+                        # buffering if there is none yet
+                        boundary = None
+                        for match in SENTENCE_END_RE.finditer(buffer, STREAM_CHUNK_MIN_CHARS - 1):
+                            boundary = match
+                        if boundary is not None:
+                            text = buffer[:boundary.end()].strip()
+                            buffer = buffer[boundary.end():]
+                            if text:
+                                delivered &= await self.send_whatsapp_message(phone, text)
+                    elif kind == "error":
+                        raise RuntimeError(event.get("message", "Dify stream error"))
+
+        except Exception as e:
+            logger.error(f"❌ Error processing with Dify: {e}")
+            if not parts:
+                answer = "Desculpe, não foi possível processar sua mensagem no momento."
+                return answer, await self.send_whatsapp_message(phone, answer)
+
+        # Whatever is left after the last sentence boundary
+        if buffer.strip():
+            delivered &= await self.send_whatsapp_message(phone, buffer.strip())
+
+        answer = "".join(parts)
+        if not answer:
+            answer = "Desculpe, não consegui processar sua mensagem."
+            delivered = await self.send_whatsapp_message(phone, answer)
+
+        logger.info(f"✅ Dify response streamed for {phone}")
+        return answer, delivered
+
     async def store_interaction(
         self,
         phone: str,
         user_message: str,
         bot_response: str,
-        timestamp: datetime
+        timestamp: datetime,
+        message_id: Optional[str] = None
     ):
         """
         Store interaction in Graphiti temporal knowledge graph
@@ -188,6 +413,11 @@ class KnowledgeBot:
         2. Store conversation episode
         3. Link entities and episodes
         4. Maintain temporal relationships
+
+        The episode is queued and written by the background episode writer,
+        so graph writes stay off the message handling path. Episodes are
+        named after the WhatsApp message id (a random UUID if unknown), so
+        messages with the same timestamp never share a name.
         """
         try:
             # Create episode content
@@ -196,19 +426,91 @@ class KnowledgeBot:
             Bot: {bot_response}
             """
 
-            # Add episode to Graphiti
-            episodes = await self.graphiti.add_episode(
-                name=f"whatsapp_conversation_{phone}_{timestamp.timestamp()}",
-                episode_body=episode_content,
-                source_description=f"WhatsApp conversation with {phone}",
-                reference_time=timestamp
-            )
+            # Queue episode for Graphiti
+            await self.write_queue.put((phone, {
+                "name": f"whatsapp_conversation_{phone}_{message_id or uuid.uuid4().hex}",
+                "episode_body": episode_content,
+                "source_description": f"WhatsApp conversation with {phone}",
+                "reference_time": timestamp
+            }))
 
-            logger.info(f"💾 Stored interaction in Graphiti for {phone}")
+            logger.info(f"💾 Queued interaction for Graphiti for {phone}")
 
         except Exception as e:
             logger.error(f"❌ Error storing interaction: {e}")
 
+    async def _episode_writer(self):
+        """
+        Background consumer that writes queued episodes to Graphiti
+
+        Collects up to EPISODE_BATCH_SIZE episodes, or whatever arrives within
+        EPISODE_BATCH_WINDOW seconds of the first one, and writes the batch
+        concurrently alongside a single conversation log flush.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.write_queue.get()]
+            deadline = loop.time() + EPISODE_BATCH_WINDOW
+
+            while len(batch) < EPISODE_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.write_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            log_result, *results = await asyncio.gather(
+                self.flush_episodes(batch),
+                *(self._add_episode(episode) for _, episode in batch),
+                return_exceptions=True
+            )
+            if isinstance(log_result, Exception):
+                logger.error(f"❌ Error writing conversation log: {log_result}")
+            for (phone, episode), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Error storing episode {episode['name']}: {result}")
+                self.write_queue.task_done()
+
+            logger.info(f"💾 Stored {len(batch)} episode(s) in Graphiti")
+
+    async def flush_episodes(self, batch: List[Tuple[str, Dict]]):
+        """
+        Record a batch of interactions in the conversation log
+
+        Writes (:User {phone})-[:SAID]->(:Episode) for every queued episode
+        with one UNWIND statement, so the per-user history can be read back
+        directly without a Graphiti search.
+        """
+        rows = [
+            {
+                "phone": phone,
+                "name": episode["name"],
+                "content": episode["episode_body"],
+                "ts": episode["reference_time"]
+            }
+            for phone, episode in batch
+        ]
+        async with self._graph_sem:
+            await self.driver.execute_query(EPISODE_LOG_QUERY, rows=rows)
+
+        # Cached context for these users no longer includes the latest turn
+        for phone, _ in batch:
+            self._ctx_cache.pop(phone, None)
+
+    async def _add_episode(self, episode: Dict):
+        """Write one episode to Graphiti, within the graph concurrency limit"""
+        async with self._graph_sem:
+            return await self.graphiti.add_episode(**episode)
+
+    async def close(self):
+        """Flush queued episodes and release resources"""
+        if self._writer_task is not None:
+            await self.write_queue.join()
+            self._writer_task.cancel()
+        await self.http_client.aclose()
+
     async def send_whatsapp_message(self, phone: str, message: str) -> bool:
         """
         Send message via Evolution API
@@ -222,11 +524,8 @@ class KnowledgeBot:
             }
 
             response = await self.http_client.post(
-                f"{EVOLUTION_API_URL}/message/sendText/{EVOLUTION_INSTANCE}",
-                headers={
-                    "apikey": EVOLUTION_API_KEY,
-                    "Content-Type": "application/json"
-                },
+                self._evolution_send_url,
+                headers=self._evolution_headers,
                 json=payload
             )
 
@@ -241,7 +540,13 @@ class KnowledgeBot:
             logger.error(f"❌ Error sending message: {e}")
             return False
 
-    async def handle_message(self, phone: str, message: str, timestamp: int):
+    async def handle_message(
+        self,
+        phone: str,
+        message: str,
+        timestamp: int,
+        message_id: Optional[str] = None
+    ):
         """
         Main message handler - orchestrates all three skills
 
@@ -250,29 +555,53 @@ class KnowledgeBot:
         2. Process with Dify RAG (Skill 2)
         3. Send response via Evolution API (Skill 1)
         4. Store interaction in Graphiti (Skill 3)
+
+        With DIFY_STREAMING, steps 2-3 overlap: the answer is relayed to
+        WhatsApp while Dify generates it. Otherwise steps 3 and 4 run
+        concurrently. ``timestamp`` is the WhatsApp message time in epoch
+        seconds.
         """
         try:
             logger.info(f"📨 Processing message from {phone}: {message}")
+            reference_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
 
             # Step 1: Retrieve context from Graphiti
             context = await self.get_conversation_context(phone)
 
-            # Step 2: Process with Dify
-            response = await self.process_with_dify(message, context, phone)
+            if DIFY_STREAMING:
+                # Steps 2-3: Stream the Dify answer to WhatsApp as it arrives
+                response, sent = await self.stream_dify_reply(message, context, phone)
 
-            # Step 3: Send response via Evolution API
-            sent = await self.send_whatsapp_message(phone, response)
-
-            if sent:
-                # Step 4: Store interaction in Graphiti
+                # Step 4: Store the complete interaction in Graphiti
                 await self.store_interaction(
                     phone=phone,
                     user_message=message,
                     bot_response=response,
-                    timestamp=datetime.fromtimestamp(timestamp / 1000)
+                    timestamp=reference_time,
+                    message_id=message_id
+                )
+            else:
+                # Step 2: Process with Dify
+                response = await self.process_with_dify(message, context, phone)
+
+                # Steps 3-4: Send response via Evolution API and store the
+                # interaction in Graphiti at the same time
+                sent, _ = await asyncio.gather(
+                    self.send_whatsapp_message(phone, response),
+                    self.store_interaction(
+                        phone=phone,
+                        user_message=message,
+                        bot_response=response,
+                        timestamp=reference_time,
+                        message_id=message_id
+                    ),
+                    return_exceptions=True
                 )
 
-            logger.info(f"✅ Message handled successfully for {phone}")
+            if sent is True:
+                logger.info(f"✅ Message handled successfully for {phone}")
+            else:
+                logger.warning(f"⚠️ Message processed but response not delivered to {phone}")
 
         except Exception as e:
             logger.error(f"❌ Error handling message: {e}")
@@ -294,7 +623,7 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("🛑 Shutting down bot...")
-    await bot.http_client.aclose()
+    await bot.close()
 
 
 @app.post("/webhook")
@@ -308,29 +637,45 @@ async def webhook_handler(
     Receives WhatsApp messages and processes them asynchronously
     """
     try:
-        data = await request.json()
-        logger.info(f"📥 Webhook received: {data.get('event')}")
+        # Text messages are small; oversized bodies (e.g. base64 media) are
+        # acknowledged without being read
+        content_length = request.headers.get("content-length")
+        if content_length and int(content_length) > WEBHOOK_MAX_BODY_BYTES:
+            return {"status": "ignored"}
+
+        # Only text messages.upsert events are handled, so skip parsing any
+        # body that cannot be one
+        body = await request.body()
+        if b'"messages.upsert"' not in body or b'"conversation"' not in body:
+            return {"status": "ignored"}
+
+        # Parse and validate the body in one pass (pydantic-core)
+        webhook = EvolutionWebhook.model_validate_json(body)
+        logger.info(f"📥 Webhook received: {webhook.event}")
 
         # Handle different event types
-        event = data.get('event')
-
-        if event == 'messages.upsert':
+        if webhook.event == 'messages.upsert':
             # Extract message data
-            message_data = data.get('data', {})
-            message_info = message_data.get('message', {})
+            message_data = MessagesUpsertData.model_validate(webhook.data or {})
+            key = message_data.key
+            message_info = message_data.message
 
             # Check if it's a text message and not from us
-            if 'conversation' in message_info and not message_data.get('key', {}).get('fromMe'):
-                phone = message_data.get('key', {}).get('remoteJid', '').split('@')[0]
-                message_text = message_info.get('conversation', '')
-                timestamp = message_data.get('messageTimestamp', 0)
+            if message_info is not None and message_info.conversation is not None and not key.fromMe:
+                # Skip webhook retries for a message that is already scheduled
+                if key.id and not bot.claim_message(key.id):
+                    logger.info(f"🔁 Duplicate webhook for message {key.id}, skipping")
+                    return {"status": "duplicate"}
+
+                phone = key.remoteJid.split('@')[0]
 
                 # Process message in background
                 background_tasks.add_task(
                     bot.handle_message,
                     phone,
-                    message_text,
-                    int(timestamp) * 1000
+                    message_info.conversation,
+                    message_data.messageTimestamp,  # Epoch seconds
+                    key.id
                 )
 
         return {"status": "success"}
@@ -340,17 +685,21 @@ async def webhook_handler(
         return {"status": "error", "message": str(e)}
 
 
+# Health payload only depends on configuration, so serialize it once
+HEALTH_RESPONSE_BODY = json.dumps({
+    "status": "healthy",
+    "services": {
+        "evolution_api": EVOLUTION_API_URL,
+        "dify": DIFY_API_URL,
+        "neo4j": NEO4J_URI
+    }
+}).encode()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "services": {
-            "evolution_api": EVOLUTION_API_URL,
-            "dify": DIFY_API_URL,
-            "neo4j": NEO4J_URI
-        }
-    }
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/stats/{phone}")
@@ -369,10 +718,15 @@ async def get_user_stats(phone: str):
 
 if __name__ == "__main__":
     import uvicorn
+    # uvloop/httptools come with uvicorn[standard]. A single worker is
+    # deliberate: the write queue, context cache and webhook de-duplication
+    # live in process memory.
     uvicorn.run(
         "bot:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        reload=os.getenv("BOT_RELOAD", "false").lower() == "true",
         log_level="info"
     )